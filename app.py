@@ -62,7 +62,7 @@ from classes.widgets.searchbar_with_icon import SearchBarWithIcon
 from classes.widgets.toggle_checkbox_button import ToggleCheckboxButton
 from classes.widgets.locked_button import LockedButton
 from classes.widgets.dictionary_list import DictionaryList
-from classes.widgets.export_button import ExportButton
+from classes.widgets.export_button import ExportButton, ExportButtonGroup
 from classes.widgets.file_path_entry import FilePathEntry
 from classes.widgets.select_file_path_entry import SelectFilePathEntry
 
@@ -1161,15 +1161,12 @@ class MainWindow(ctk.CTk):
             """
             exportDirectoryEntry.reset()  # Reset the file path entry when toggling export options
             
+            # toggle the clicked export option and deactivate the other, redrawing both in one batch
             if buttonName == "Anki Deck": # toggle Anki Deck export
-                exportAnkiButton.toggle()
-                if exportDBButton.get_state(): # if Lexes DB export is active, deactivate it
-                    exportDBButton.set_state(False)
+                exportButtonGroup.select(exportAnkiButton)
 
             elif buttonName == "Lexes DB": # toggle Lexes DB export
-                exportDBButton.toggle()
-                if exportAnkiButton.get_state(): # if Anki Deck export is active, deactivate it
-                    exportAnkiButton.set_state(False)
+                exportButtonGroup.select(exportDBButton)
             
             # if both buttons are inactive, change colours of export directory entry to represent deactivation
             if not exportAnkiButton.get_state() and not exportDBButton.get_state():
@@ -1190,6 +1187,8 @@ class MainWindow(ctk.CTk):
                                                 text_color_neutral=ExportBlue, text_color_active=LightGreen2, border_color=ExportBlue, image_size=(50,50), callback_command=toggleExport)
         exportDBButton.pack(padx=15, pady=0, side='left')
 
+        exportButtonGroup = ExportButtonGroup(exportAnkiButton, exportDBButton) # keeps export options mutually exclusive
+
         # Export File Directory Selection
         exportDirectoryFrame = ctk.CTkFrame(background, corner_radius=0, fg_color="transparent")
         exportDirectoryFrame.pack(padx=35, pady=(20,0), fill="x")
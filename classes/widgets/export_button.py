@@ -8,9 +8,10 @@ Purpose:
 Contains:
     - ExportButton class, a CTkFrame-based widget with custom styling, icons, and text for both states.
     - Methods for toggling state, updating appearance, and handling click events.
+    - ExportButtonGroup class, a controller that keeps a set of ExportButtons mutually exclusive and batches their redraws.
 
 Naming Conventions:
-    - Class names: PascalCase (ExportButton).
+    - Class names: PascalCase (ExportButton, ExportButtonGroup).
     - Public method names: snake_case (get_state, set_state).
     - Private method names: snake_case, prefixed with an underscore (e.g., _on_click, _update_appearance).
     - Attributes: snake_case (border_color, border_width, state_active, callback_command).
@@ -18,11 +19,17 @@ Naming Conventions:
 
 Usage:
     Use ExportButton to provide a visually distinct export button with active/inactive styles and callback support.
+    Use ExportButtonGroup.select to switch between mutually exclusive ExportButtons with a single batched redraw.
     ExportButton used for export buttons (Anki Deck and Lexes DB) in Export Window.
 """
 
 ### Module Imports ###
 import customtkinter as ctk
+import inspect
+import weakref
+
+### Local Class Imports ###
+from classes.widgets.image_cache import get_ctk_image
 
 class ExportButton(ctk.CTkFrame):
     def __init__(self, master, *,
@@ -63,53 +70,124 @@ class ExportButton(ctk.CTkFrame):
         - border_color (str): The border color for the button. String as it represents a color value.
         - callback_command (callable): The function to call when the button is clicked. Callable as it represents a callback function.
         """
-        super().__init__(master, width=width, height=height,
-                         corner_radius=corner_radius, fg_color=bg_color, **kwargs)
-        self.pack_propagate(False)
+        ### Button Frame (clickable area) ###
+        # The widget itself is the styled frame, so only one rounded rectangle is drawn per paint
+        super().__init__(master, width=width, height=height, corner_radius=corner_radius,
+                         fg_color=fg_color_neutral, bg_color=bg_color,
+                         border_color=border_color, border_width=2.5, **kwargs)
+        self.grid_propagate(False) # keep the fixed width/height, children sit in static grid cells
+        self.grid_rowconfigure(0, weight=1) # vertically centre the single row
+        self.grid_columnconfigure(1, weight=1)
 
         self.border_color = border_color
         self.border_width = 2.5
         self.state_active = False # initial state is inactive
-        self.callback_command = callback_command # callback function to execute on click
+        self._last_rendered_state = False # state currently drawn on screen, used to skip redundant redraws
+        # Callback function to execute on click. Bound methods are held weakly so the button does not keep its owner (e.g. the Export Window) alive
+        self._callback_ref = weakref.WeakMethod(callback_command) if inspect.ismethod(callback_command) else (lambda: callback_command)
+        self._click_guard_id = None # pending cooldown 'after' id, set while further clicks are ignored
 
         ### Store images and config ###
         self.neutral_text = neutral_text
         self.active_text = active_text
-        self._image_neutral = ctk.CTkImage(light_image=image_neutral, dark_image=image_neutral, size=image_size) if image_neutral else None
-        self._image_active = ctk.CTkImage(light_image=image_active, dark_image=image_active, size=image_size) if image_active else None
+        # CTkImages are built lazily on first use, so the active image is only created once the button is toggled
+        self._image_sources = {False: image_neutral, True: image_active}
+        self._image_size = image_size
+        self._image_neutral = None
+        self._image_active = None
+        self._needs_image_swap = image_neutral is not image_active # identical (or both missing) images never need reconfiguring
         self._fg_color_neutral = fg_color_neutral
         self._fg_color_active = fg_color_active
         self._text_color_neutral = text_color_neutral
         self._text_color_active = text_color_active
 
-        ### Button Frame (clickable area) ###
-        self.button_frame = ctk.CTkFrame(self, corner_radius=corner_radius,
-                                         fg_color=self._fg_color_neutral, border_color=self.border_color, border_width=self.border_width)
-        self.button_frame.pack(fill="both", expand=True)
-
         ### Icon ###
-        self.image_label = ctk.CTkLabel(self.button_frame, text="", image=self._image_neutral,
+        self.image_label = ctk.CTkLabel(self, text="", image=self._get_image(False),
                                         fg_color="transparent")
-        self.image_label.pack(side="left", padx=10)
+        self.image_label.grid(row=0, column=0, padx=10)
 
         ### Text ###
-        self.text_label = ctk.CTkLabel(self.button_frame, text=self.neutral_text, font=font,
+        self.text_label = ctk.CTkLabel(self, text=self.neutral_text, font=font,
                                        text_color=self._text_color_neutral, fg_color="transparent")
-        self.text_label.pack(side="left", padx=0, pady=(4,10))
+        self.text_label.grid(row=0, column=1, padx=0, pady=(4,10), sticky="w")
+
+        ### Bind clicks once to a shared bindtag and add it to all subcomponents recursively ###
+        self._click_tag = f"ExportButton{id(self)}"
+        self._on_click = self._build_click_handler()
+        self.bind_class(self._click_tag, "<Button-1>", self._on_click)
+        self._add_click_tag(self)
+
+    @property
+    def callback_command(self) -> callable:
+        """
+        Returns the callback function executed on click, or None if it was a bound method whose owner has been garbage collected.
+        """
+        return self._callback_ref()
+
+    def _add_click_tag(self, widget) -> None:
+        """
+        Private Method
+
+        Prepends the shared click bindtag to the widget and all its descendants (including customtkinter's internal canvases and labels).
+        - widget (tk.Widget): The widget to tag. Tkinter Widget as it represents the root of the subtree to tag.
+        """
+        widget.bindtags((self._click_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_click_tag(child)
+
+    def _get_image(self, active: bool):
+        """
+        Private Method
+
+        Returns the CTkImage for the given state, building (or fetching from the shared cache) on first access.
+        - active (bool): Boolean as it represents which state's image to return.
+        """
+        image = self._image_active if active else self._image_neutral
+        if image is None:
+            source = self._image_sources[active]
+            if source is None:
+                return None
+            image = get_ctk_image(source, self._image_size)
+            if active:
+                self._image_active = image
+            else:
+                self._image_neutral = image
+        return image
+
+    def _build_click_handler(self) -> callable:
+        """
+        Private Method
 
-        ### Bind clicks to all subcomponents recursively ###
-        for widget in (self, self.button_frame, self.image_label, self.text_label):
-            widget.bind("<Button-1>", self._on_click)
+        Builds the click handler as a closure over the callback and active text, so a click runs a single Python frame.
+        Clicks within a 50ms cooldown of the previous click are ignored to avoid double toggles.
+        """
+        callback_ref = self._callback_ref
+        active_text = self.active_text
+        after = self.after
+        release = self._release_click_guard
+
+        def _on_click(event=None) -> str:
+            """
+            Handles button click event. Triggers the callback (which toggles the button state).
+            - event (tk.Event): The click event. Tkinter Event containing information about the click.
+            """
+            if self._click_guard_id is not None:
+                return "break"
+            callback = callback_ref()
+            if callback:
+                callback(active_text)
+            self._click_guard_id = after(50, release)
+            return "break"
 
-    def _on_click(self, event=None) -> str:
+        return _on_click
+
+    def _release_click_guard(self) -> None:
         """
         Private Method
 
-        Handles button click event. Triggers the callback and toggles the button state.
-        - event (tk.Event): The click event. Tkinter Event containing information about the click.
+        Ends the click cooldown so the next click is handled.
         """
-        self._toggle_command()
-        return "break"
+        self._click_guard_id = None
 
     def toggle(self) -> None:
         """
@@ -119,30 +197,38 @@ class ExportButton(ctk.CTkFrame):
         """
         self.state_active = not self.state_active
         self._update_appearance()
-    
-    def _toggle_command(self) -> None:
-        """
-        Private Method
-
-        Executes the callback command with the active text.
-        """
-        if self.callback_command:
-            self.callback_command(self.active_text)
 
     def _update_appearance(self) -> None:
         """
         Private Method
 
         Updates the button appearance based on the current state (active/inactive).
+        Skips the reconfigure if the current state is already drawn.
         """
+        if self.state_active == self._last_rendered_state:
+            return
+        self._last_rendered_state = self.state_active
+
         if self.state_active:
-            self.button_frame.configure(fg_color=self._fg_color_active)
-            self.text_label.configure(text=self.active_text, text_color=self._text_color_active)
-            self.image_label.configure(image=self._image_active)
+            self.configure(fg_color=self._fg_color_active)
+            self._set_text(self.active_text, self._text_color_active)
+            if self._needs_image_swap:
+                self.image_label.configure(image=self._get_image(True))
         else:
-            self.button_frame.configure(fg_color=self._fg_color_neutral)
-            self.text_label.configure(text=self.neutral_text, text_color=self._text_color_neutral)
-            self.image_label.configure(image=self._image_neutral)
+            self.configure(fg_color=self._fg_color_neutral)
+            self._set_text(self.neutral_text, self._text_color_neutral)
+            if self._needs_image_swap:
+                self.image_label.configure(image=self._get_image(False))
+
+    def _set_text(self, text: str, text_color: str) -> None:
+        """
+        Private Method
+
+        Sets the label text and colour in a single CTkLabel configure call.
+        - text (str): The text to display. String as it represents the button label.
+        - text_color (str): The text colour to apply. String as it represents a color value.
+        """
+        self.text_label.configure(text=text, text_color=text_color)
 
     def get_state(self) -> bool:
         """
@@ -159,5 +245,59 @@ class ExportButton(ctk.CTkFrame):
         Sets the button state to active or inactive, updating appearance accordingly.
         - active (bool): Boolean as it represents the target state.
         """
+        if active == self.state_active: # no change, nothing to redraw
+            return
         self.state_active = active
-        self._update_appearance()
\ No newline at end of file
+        self._update_appearance()
+
+class ExportButtonGroup:
+    def __init__(self, *buttons: ExportButton):
+        """
+        Initialise the ExportButtonGroup controller for a set of mutually exclusive ExportButtons.
+        - buttons (ExportButton): The buttons in the group. ExportButton as they represent the export options.
+        """
+        self.buttons = buttons
+        self._pending = [] # buttons whose state changed but have not been redrawn yet
+        self._flush_scheduled = False
+
+    def select(self, target: ExportButton) -> None:
+        """
+        Public Method
+
+        Toggles the target button and deactivates every other active button in the group.
+        States update immediately, redraws of all changed buttons are batched into a single idle callback.
+        - target (ExportButton): The button that was clicked. ExportButton as it represents the selected export option.
+        """
+        target.state_active = not target.state_active
+        self._mark_changed(target)
+
+        for button in self.buttons:
+            if button is not target and button.state_active:
+                button.state_active = False
+                self._mark_changed(button)
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            target.after_idle(self._flush)
+
+    def _mark_changed(self, button: ExportButton) -> None:
+        """
+        Private Method
+
+        Queues a button for redraw on the next flush.
+        - button (ExportButton): The button whose state changed. ExportButton as it represents the button to redraw.
+        """
+        if button not in self._pending:
+            self._pending.append(button)
+
+    def _flush(self) -> None:
+        """
+        Private Method
+
+        Redraws all buttons whose state changed since the last flush.
+        """
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        for button in pending:
+            if button.winfo_exists():
+                button._update_appearance()
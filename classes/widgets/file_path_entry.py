@@ -32,6 +32,12 @@ import os
 ### Local Class Imports ###
 from classes.widgets.export_button import ExportButton
 
+### File Dialog Constants ###
+# Pre-built so the file dialog does not rebuild the file type lists on every click
+_CSV_TYPES = (("CSV Files", "*.csv"),)
+_DB_TYPES = (("SQLite Database Files", "*.db"),)
+_EXT_DIALOG = {".csv": _CSV_TYPES, ".db": _DB_TYPES} # extension -> dialog filetypes
+
 class FilePathEntry(ctk.CTkFrame):
     def __init__(self,
                  master,
@@ -85,6 +91,7 @@ class FilePathEntry(ctk.CTkFrame):
         self.option_two = option_two
 
         self.file_path = ""
+        self._dialog_after_id = None # 'after' id of a save dialog scheduled but not yet open
 
     def _open_dialog(self, event=None) -> None:
         """
@@ -96,43 +103,69 @@ class FilePathEntry(ctk.CTkFrame):
         ### Get the file type based on the selected export option ###
         if self.option_one.get_state():
             file_type = ".csv"
-            file_types = [("CSV Files", "*.csv")] # List of file types for CSV export for easy comparison
         elif self.option_two.get_state():
             file_type = ".db"
-            file_types = [("SQLite Database Files", "*.db")] # List of file types for DB export for easy comparison
         else:
             file_type = ""
-            file_types = []
 
         ### Open the file dialog based on the selected file type ###
-        if file_type:
-            file_path = filedialog.asksaveasfilename(title="Save As",
-                                                    defaultextension=file_type,
-                                                    filetypes=file_types) # only shows matching file types and selecting a duplicate will overwrite
+        file_types = _EXT_DIALOG.get(file_type)
+        if file_types:
+            if self._dialog_after_id is not None: # dialog already scheduled by a previous click
+                return
+            # Show feedback first, then open the modal dialog on a later tick so the label redraw is not blocked
+            self._set_label_text("Opening…")
+            self._dialog_after_id = self.after(10, self._show_save_dialog, file_type, file_types)
         else:
             messagebox.showerror("No File Type Selected", "Please select a file type to export the entries to.", parent=self.master)
-            file_path = ""
-        
+            self._apply_path("", file_type)
+
+    def _show_save_dialog(self, file_type: str, file_types: tuple) -> None:
+        """
+        Private Method
+
+        Opens the (modal) save file dialog and applies the chosen path. Scheduled by _open_dialog after the label has been updated.
+        Does nothing if the widget has been destroyed in the meantime.
+        - file_type (str): The required file extension. String as it represents the extension (e.g. ".csv").
+        - file_types (tuple): The file type filters for the dialog. Tuple as it represents (description, pattern) pairs.
+        """
+        self._dialog_after_id = None
+        if not self.winfo_exists():
+            return
+        file_path = filedialog.asksaveasfilename(title="Save As",
+                                                defaultextension=file_type,
+                                                filetypes=file_types) # only shows matching file types and selecting a duplicate will overwrite
+        self._apply_path(file_path, file_type)
+
+    def _apply_path(self, file_path: str, file_type: str) -> None:
+        """
+        Private Method
+
+        Validates the selected file path's extension, updates the label and triggers the callback.
+        - file_path (str): The path returned by the file dialog, or "" if cancelled. String as it represents the file path.
+        - file_type (str): The required file extension. String as it represents the extension (e.g. ".csv").
+        """
         # Validate file extension
         if file_path:
-            root, ext = os.path.splitext(file_path)
+            has_ext = "." in os.path.basename(file_path).lstrip(".") # leading dots mark hidden files, not extensions
+            matches_type = file_path.lower().endswith(file_type)
             # If wrong extension, show error and return
-            if ext and ext.lower() != file_type:
+            if has_ext and not matches_type:
                 messagebox.showerror("Invalid File Extension",
                     f"Please save the file as {file_type} only.",
                     parent=self.master)
                 self.file_path = ""
-                self.path_label.configure(text=self.placeholder_text)
+                self._set_label_text(self.placeholder_text)
                 return
             # If missing extension, add it
-            if not ext:
-                file_path = file_path + file_type
+            if not matches_type:
+                file_path += file_type
 
             self.file_path = file_path
-            self.path_label.configure(text=self.file_path)
+            self._set_label_text(self.file_path)
         else:
             self.file_path = ""
-            self.path_label.configure(text=self.placeholder_text)
+            self._set_label_text(self.placeholder_text)
 
         if self.on_callback:
             self.on_callback(self.file_path)
@@ -152,7 +185,7 @@ class FilePathEntry(ctk.CTkFrame):
         Resets the file path to "" and clears the entry label.
         """
         self.file_path = ""
-        self.path_label.configure(text=self.placeholder_text)  # Reset label to placeholder text
+        self._set_label_text(self.placeholder_text)  # Reset label to placeholder text
     
     def change_text_color(self, color: str) -> None:
         """
@@ -161,4 +194,26 @@ class FilePathEntry(ctk.CTkFrame):
         Changes the text color of the entry label.
         - color (str): The new text color for the entry label. String as it represents a color value.
         """
-        self.path_label.configure(text_color=color)
\ No newline at end of file
+        if self.path_label.cget("text_color") != color: # skip redraw if colour is unchanged
+            self.path_label.configure(text_color=color)
+
+    def destroy(self) -> None:
+        """
+        Public Method
+
+        Destroys the widget, cancelling a save dialog still scheduled by _open_dialog so it never opens for a closed window.
+        """
+        if self._dialog_after_id is not None:
+            self.after_cancel(self._dialog_after_id)
+            self._dialog_after_id = None
+        super().destroy()
+
+    def _set_label_text(self, text: str) -> None:
+        """
+        Private Method
+
+        Updates the entry label text, skipping the reconfigure (and CTkLabel redraw) if the text is unchanged.
+        - text (str): The new text for the entry label. String as it represents the displayed path or placeholder.
+        """
+        if self.path_label.cget("text") != text:
+            self.path_label.configure(text=text)
\ No newline at end of file
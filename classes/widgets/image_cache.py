@@ -0,0 +1,39 @@
+"""
+File: classes/widgets/image_cache.py
+
+Purpose:
+    Provides the CTkImage cache shared by the Lexes custom widgets. Widgets built from the same PIL image at the same size
+    share a single CTkImage instead of each wrapping (and resizing) their own copy.
+
+Contains:
+    - get_ctk_image function: Returns the shared CTkImage for a PIL image and size, creating it on first use.
+
+Naming Conventions:
+    - Public function names: snake_case (get_ctk_image)
+    - Module-level cache: UPPERCASE, prefixed with an underscore (_CTK_IMAGE_CACHE)
+    - General code: snake_case. NOTE: Custom widgets use snake_case while the rest of the codebase uses camelCase.
+
+Usage:
+    Use get_ctk_image in custom widgets wherever a PIL icon is wrapped in a CTkImage.
+    get_ctk_image used by ExportButton, LockedButton, SearchBarWithIcon and SelectFilePathEntry.
+"""
+
+### Module Imports ###
+import customtkinter as ctk
+
+### Shared Image Cache ###
+# CTkImages keyed by (id of PIL image, size). Each cached CTkImage keeps its PIL image alive, so the id cannot be reused while the entry exists.
+_CTK_IMAGE_CACHE: dict[tuple[int, tuple], ctk.CTkImage] = {}
+
+def get_ctk_image(img, size: tuple) -> ctk.CTkImage:
+    """
+    Returns the shared CTkImage for the given PIL image and size, creating it on first use.
+    The full-resolution image is wrapped, CTkImage resizes it to size * widget scaling so icons stay sharp on scaled displays.
+    - img (Image): The PIL image to wrap. Image as it represents the icon image.
+    - size (tuple): The display size of the image. Tuple as it represents the dimensions (width, height).
+    """
+    key = (id(img), size)
+    cached = _CTK_IMAGE_CACHE.get(key)
+    if cached is None:
+        cached = _CTK_IMAGE_CACHE[key] = ctk.CTkImage(light_image=img, dark_image=img, size=size)
+    return cached
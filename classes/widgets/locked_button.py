@@ -7,14 +7,15 @@ Purpose:
     Useful for actions that should only be available after certain conditions are met.
 
 Contains:
-    - LockedButton class: A CTkFrame-based widget containing a CTkButton whose enabled/disabled state and appearance are managed.
+    - LockedButton class: A CTkButton subclass whose enabled/disabled state and appearance are managed.
+    - _intern_color helper: Interns colour strings so identically styled buttons share them.
     - Methods for locking/unlocking the button, setting its command callback, and handling clicks.
 
 Naming Conventions:
     - Class names: PascalCase (LockedButton)
     - Public method names: snake_case (unlock, lock, set_command)
-    - Private method names: snake_case, prefixed with an underscore (_on_click)
-    - Attributes: snake_case (button, _is_locked, _command, _neutral_icon, _active_icon)
+    - Private method names: snake_case, prefixed with an underscore (_noop)
+    - Attributes: snake_case (_is_locked, _neutral_icon, _active_icon, _active_icon_src)
     - General code: snake_case. NOTE: Custom widgets use snake_case while the rest of the codebase uses camelCase.
 
 Usage:
@@ -25,8 +26,22 @@ Usage:
 
 #### Module Imports ###
 import customtkinter as ctk
-
-class LockedButton(ctk.CTkFrame):
+import sys
+
+### Local Class Imports ###
+from classes.widgets.image_cache import get_ctk_image
+
+def _intern_color(color):
+    """
+    Returns the colour with its string(s) interned, so buttons styled with equal colours share the same string objects.
+    (light, dark) colour pairs are interned element-wise and returned as a tuple.
+    - color (str | tuple): The colour value. String or tuple as it represents a single colour or a (light, dark) pair.
+    """
+    if isinstance(color, str):
+        return sys.intern(color)
+    return tuple(sys.intern(c) for c in color)
+
+class LockedButton(ctk.CTkButton):
     def __init__(self, master, *,
                  neutral_icon,
                  active_icon,
@@ -57,65 +72,82 @@ class LockedButton(ctk.CTkFrame):
         - text (str): The text to display on the button. String as it represents the button text.
         - command (callable): The callback function to call when the button is clicked. Callable as it represents a callback function.
         """
-        super().__init__(master, width=width, height=height, fg_color="transparent", **kwargs)
-        self.pack_propagate(False)
+        neutral_ctk_icon = get_ctk_image(neutral_icon, icon_size)
 
-        self._command = command # callback function to execute on click
+        ### Button Setup ###
+        # LockedButton is the CTkButton itself, so no wrapper frame is created
+        super().__init__(master,
+                         width=width,
+                         height=height,
+                         image=neutral_ctk_icon,
+                         text=text,
+                         corner_radius=corner_radius,
+                         anchor=anchor,
+                         fg_color=fg_color_neutral,
+                         hover_color=fg_color_neutral,  # no hover when locked
+                         command=self._noop,
+                         state="disabled", # starts locked
+                         **kwargs)
+
+        # NOTE: CTkButton stores its own click handler in _command. The user callback lives in _unlocked_cfg["command"],
+        # the click handler is swapped between _noop (locked) and the user callback (unlocked), so clicks need no lock check.
         self._is_locked = True # initial state is locked (disabled)
 
         ### Assets and Styling ###
-        self._neutral_icon = ctk.CTkImage(light_image=neutral_icon, dark_image=neutral_icon, size=icon_size)
-        self._active_icon = ctk.CTkImage(light_image=active_icon, dark_image=active_icon, size=icon_size)
-        self._fg_color_neutral = fg_color_neutral
-        self._fg_color_active = fg_color_active
-        self._hover_color_active = hover_color_active
-
-        ### Button Setup ###
-        self.button = ctk.CTkButton(self,
-                                    width=width,
-                                    height=height,
-                                    image=self._neutral_icon,
-                                    text=text,
-                                    corner_radius=corner_radius,
-                                    anchor=anchor,
-                                    fg_color=self._fg_color_neutral,
-                                    hover_color=self._fg_color_neutral,  # no hover when locked
-                                    command=self._on_click,
-                                    state="disabled") # starts locked
-        self.button.pack(fill="both", expand=True)
-
-    def _on_click(self) -> None:
+        self._neutral_icon = neutral_ctk_icon
+        self._active_icon = None # built on first unlock(), since a button may never be unlocked
+        self._active_icon_src = active_icon
+        self._icon_size = icon_size
+        self._fg_color_neutral = _intern_color(fg_color_neutral)
+        self._fg_color_active = _intern_color(fg_color_active)
+        self._hover_color_active = _intern_color(hover_color_active)
+
+        ### Pre-built configure kwargs for each state ###
+        self._locked_cfg = {"image": self._neutral_icon,
+                            "fg_color": self._fg_color_neutral,
+                            "hover_color": self._fg_color_neutral, # no hover when locked
+                            "state": "disabled",
+                            "command": self._noop}
+        self._unlocked_cfg = {"image": self._active_icon, # filled in on first unlock()
+                              "fg_color": self._fg_color_active,
+                              "hover_color": self._hover_color_active,
+                              "state": "normal",
+                              "command": command or self._noop}
+
+    @staticmethod
+    def _noop() -> None:
         """
         Private Method
 
-        Handles the button click event. If the button is unlocked, it executes the command.
+        Click handler used while locked (or when no command is set). Does nothing.
         """
-        if not self._is_locked and self._command:
-            self._command()
 
     def unlock(self) -> None:
         """
         Public Method
 
         Unlocks (enables) the button, updates its appearance, and allows clicking.
+        Does nothing if the button is already unlocked.
         """
+        if not self._is_locked:
+            return
         self._is_locked = False
-        self.button.configure(image=self._active_icon,
-                              fg_color=self._fg_color_active,
-                              hover_color=self._hover_color_active,
-                              state="normal")
+        if self._active_icon is None:
+            self._active_icon = get_ctk_image(self._active_icon_src, self._icon_size)
+            self._unlocked_cfg["image"] = self._active_icon
+        self.configure(**self._unlocked_cfg)
 
     def lock(self) -> None:
         """
         Public Method
 
         Locks (disables) the button, updates its appearance, and prevents clicking.
+        Does nothing if the button is already locked.
         """
+        if self._is_locked:
+            return
         self._is_locked = True
-        self.button.configure(image=self._neutral_icon,
-                              fg_color=self._fg_color_neutral,
-                              hover_color=self._fg_color_neutral,
-                              state="disabled")
+        self.configure(**self._locked_cfg)
 
     def set_command(self, command) -> None:
         """
@@ -124,4 +156,6 @@ class LockedButton(ctk.CTkFrame):
         Sets the callback function to be called when the button is clicked (if unlocked).
         - command (callable): The callback function to execute on button click. Callable as it represents a callback function.
         """
-        self._command = command
\ No newline at end of file
+        self._unlocked_cfg["command"] = command or self._noop
+        if not self._is_locked: # swap the live click handler straight away
+            self.configure(command=self._unlocked_cfg["command"])
\ No newline at end of file
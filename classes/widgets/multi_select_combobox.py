@@ -7,14 +7,15 @@ Purpose:
 
 Contains:
     - MultiSelectComboBox class: A CTkFrame-based widget containing a dropdown list with checkboxes, "Require all tags" and "None" toggles,
-    tooltips for truncated text, and scrollable options.
+    tooltips for truncated text (one tooltip window shared by all instances), and scrollable options. Option rows are virtualised (only visible rows are drawn, as canvas items).
     - Methods for showing/hiding the dropdown, updating selection visuals, refreshing options, and retrieving selected values.
 
 Naming Conventions:
     - Class names: PascalCase (MultiSelectComboBox)
     - Public method names: snake_case (get_selected, require_all_selected, refresh_options)
     - Private method names: snake_case, prefixed with an underscore (e.g., _toggle_menu, _create_menu_popup)
-    - Attributes: snake_case (option_frames, option_labels, selected_indices, etc.)
+    - Attributes: snake_case (selected_indices, dropdown_height, etc.)
+    - Constants: UPPERCASE (ROW_HEIGHT)
     - General code: snake_case. NOTE: Custom widgets use snake_case while the rest of the codebase uses camelCase.
 
 Usage:
@@ -24,10 +25,23 @@ Usage:
 """
 
 ### Module Imports ###
+import bisect
+import math
 import tkinter as tk
 import customtkinter as ctk
 
+### Constants ###
+ROW_HEIGHT = 40 # pixel height of each option row in the dropdown
+
 class MultiSelectComboBox(ctk.CTkFrame):
+    # One tooltip window shared by every MultiSelectComboBox (only one can be hovered at a time), created on first use
+    _shared_tooltip = None
+    _shared_tooltip_label = None
+    _tooltip_owner = None # the combobox currently showing the shared tooltip
+
+    # Pre-built main label texts for small selection counts (index = count, 0 uses the instance's default_text)
+    _SELECTED_LABELS = [None, "1 tag selected..."] + [f"{i} tags selected..." for i in range(2, 33)]
+
     def __init__(self, master, *,
                  options: list[str],
                  width: int = 200,
@@ -85,18 +99,38 @@ class MultiSelectComboBox(ctk.CTkFrame):
 
         ### Option Config ###
         self.selected_indices = set() # Uses set for efficient membership testing
-        self.option_frames = [] # list of frames for each option in the dropdown
-        self.option_labels = [] # list of labels for each option in the dropdown
+        self._selected_sorted = [] # the same indices kept in ascending order (via bisect), so get_selected never re-sorts
+        # Rows are virtualised: only enough row widgets to fill the viewport are created and recycled as the list scrolls
+        self._row_pool = [] # recycled row slots (dicts holding the row's canvas item ids and displayed index)
+        # Per-option display data, kept as parallel lists to self.options. Entries are None until an option is first displayed
+        self._prev_options = [] # options the display lists were built for
+        self._display_text = [] # (possibly truncated) label text
+        self._is_truncated = [] # whether the label text was truncated (option needs a tooltip)
+        self._stripped_options = [] # option text with surrounding whitespace removed, as returned by get_selected
+        self._visible_rows = {} # maps option index -> row slot currently displaying it
         
+        ### Deferred Visual Updates ###
+        self._pending_refresh = False # True while a _flush_visual_state idle callback is scheduled
+        self._pending_visual_state = None # label/checkbox state waiting to be applied by the next flush
+        self._last_selected_count = 0 # selection count _on_select last saw, to detect crossing zero
+        self._current_visual_state = {"require_state": "disabled", "none_state": None} # last applied checkbox states (None = not yet applied)
+        self._dirty_rows = set() # option indices waiting to be repainted by the next flush
+
         self.prevent_reopen = False # flag to prevent immediate reopening of the dropdown after closing
-        self.measure_font = ctk.CTkFont(family=self.dropdown_font[0], size=self.dropdown_font[1]) # font for measuring text width
+        self._pending_hide = None # 'after' id of a focus-out close waiting to run, see _on_popup_focus_out
+        self._outside_click_id = None # Tcl command name of the outside-click handler, bound on the toplevel only while the menu is open
+        # Font for drawing and measuring the option rows. They are canvas text items, which CTk does not scale, so the widget scaling is applied here
+        self.measure_font = ctk.CTkFont(family=self.dropdown_font[0], size=round(self.dropdown_font[1] * self._get_widget_scaling()))
+        # Text measurement caches for measure_font (the dropdown font is fixed for the widget's lifetime, so they never need clearing)
+        self._char_widths = {} # character -> pixel width
+        self._measure_cache = {} # exact font.measure results keyed by text
+        self._truncate_cache = {} # (text, max width) -> truncated text
+        self._ellipsis_width = None # width of "..." in measure_font, measured on first truncation
+        self._max_label_width = self.width - 30 # widest option text (px) that fits a row label before truncation
 
         # Dynamically set dropdown height based on number of options
-        numOptions = max(1, len(self.options))
-        if numOptions < 5:
-            self.dropdown_height = 40 * numOptions + 25
-        else: # Max height for 5 rows  displayed
-            self.dropdown_height = 200 + 25
+        self.dropdown_height = self._compute_dropdown_height(len(self.options))
+        self._popup_geom_size = f"{self.width}x{self.dropdown_height}" # size part of the popup geometry string, rebuilt when the height changes
 
         self.configure(border_width=1, border_color=self.border_color)
 
@@ -129,19 +163,38 @@ class MultiSelectComboBox(ctk.CTkFrame):
         self.dropdown_icon.bind("<Button-1>", self._toggle_menu)
         self.main_label.bind("<Button-1>", self._toggle_menu)
 
+        ### Dropdown Popup ###
+        # Built on first open by _show_menu, many comboboxes are never opened. State that must exist before then is set up here.
         self.popup = None
-        self.inner_frame = None
+        self.canvas = None
         self.is_menu_open = False
+        self.require_all_var = tk.BooleanVar(value=False)
+        self.no_tags_var = tk.BooleanVar(value=False)
+        self._sync_display_text()
 
-        ### Build Dropdown Popup ###
-        self._create_menu_popup()
+        self._last_popup_geometry = None # geometry string last applied to the popup
+
+    @staticmethod
+    def _compute_dropdown_height(num_options: int) -> int:
+        """
+        Private Static Method
+
+        Returns the dropdown height in pixels for the given number of options (one 40px row each, max 5 rows shown, plus the 25px header).
+        - num_options (int): The number of options in the dropdown. Integer as it represents the option count.
+        """
+        return (200 + 25) if num_options >= 5 else (ROW_HEIGHT * max(1, num_options) + 25)
 
     def _create_menu_popup(self) -> None:
         """
         Private Method
 
-        Creates the dropdown popup window and populates it with option frames, checkboxes, and labels.
+        Creates the dropdown popup window and populates it with option rows, checkboxes, and labels. Called through _ensure_popup on first open.
         """
+        # Row slots belong to the canvas being created, drop any left over from a destroyed popup
+        self._row_pool = []
+        self._visible_rows = {}
+        self._dirty_rows = set()
+
         self.popup = tk.Toplevel(self)
         self.popup.withdraw()
         self.popup.overrideredirect(True)
@@ -155,7 +208,6 @@ class MultiSelectComboBox(ctk.CTkFrame):
         self.require_frame.grid(row=0, column=0, columnspan=2, sticky="ew")
 
         # Left: Require All Tags? Checkbox
-        self.require_all_var = tk.BooleanVar(value=False)
         self.require_checkbox = ctk.CTkCheckBox(self.require_frame,
                                                 text="Require all tags?",
                                                 variable=self.require_all_var,
@@ -168,12 +220,11 @@ class MultiSelectComboBox(ctk.CTkFrame):
                                                 border_color=self.text_color,
                                                 checkmark_color='white',
                                                 border_width=1,
-                                                state="disabled",
+                                                state=self._current_visual_state["require_state"],
                                                 text_color_disabled="#9FA69C")
         self.require_checkbox.grid(row=0, column=0, sticky="w", padx=10, pady=0)
 
         # Right: None label and checkbox
-        self.no_tags_var = tk.BooleanVar(value=False)
         self.no_tags_frame = ctk.CTkFrame(self.require_frame, fg_color="transparent", corner_radius=0)
         self.no_tags_frame.grid(row=0, column=1, sticky="e", padx=5, pady=0)
 
@@ -202,6 +253,13 @@ class MultiSelectComboBox(ctk.CTkFrame):
         self.require_frame.grid_columnconfigure(0, weight=1)
         self.require_frame.grid_columnconfigure(1, weight=0)
 
+        # Apply the last recorded "None" state (set by refresh_options or the _on_select flush) to the freshly built checkbox,
+        # e.g. one recorded before the popup existed, or the state the previous popup had if it was rebuilt
+        none_state = self._current_visual_state["none_state"]
+        if none_state is not None:
+            self._current_visual_state["none_state"] = None
+            self._set_none_state(none_state)
+
         ### Canvas and Scrollbar ###
         self.canvas = tk.Canvas(self.outer_frame,
                                 bg=self.dropdown_bg_color,
@@ -217,107 +275,324 @@ class MultiSelectComboBox(ctk.CTkFrame):
         self.outer_frame.grid_rowconfigure(1, weight=1)
         self.outer_frame.grid_columnconfigure(0, weight=1)
 
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = scrollbar
+        self._last_option_count = None # option count the scrollregion was sized for
+        self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
+        self._update_scrollregion()
+        self._viewport_height = None # last canvas height the rows were laid out for
+        self._repopulate_after_id = None # pending idle refill of the row slots, see _schedule_repopulate
+        self.canvas.bind("<Configure>", self._on_canvas_configure) # viewport resized, rows may need refilling
 
-        self.inner_frame = tk.Frame(self.canvas, bg=self.dropdown_bg_color, width=self.width)
-        self.inner_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        ### Click Dispatcher ###
+        # Rows are canvas items (no row widgets), so one canvas <Button-1> handler covers every row
+        self.canvas.bind("<Button-1>", self._on_canvas_click)
 
-        self.canvas.create_window((0, 0), window=self.inner_frame, anchor="nw")
+        ### Tooltip Dispatcher ###
+        # The class-wide tooltip window (see _get_tooltip) driven by pointer motion over the canvas
+        self._hover_idx = None # option index the tooltip is currently showing for
+        self.canvas.bind("<Motion>", self._on_canvas_motion)
 
         ### Scroll Bindings ###
-        self.canvas.bind("<Enter>", lambda e: self._bind_mousewheel())
-        self.canvas.bind("<Leave>", lambda e: self._unbind_mousewheel())
+        # Bound on the popup only (no bind_all), it receives wheel events for itself and every widget inside it
+        self._bind_mousewheel()
+        self.canvas.bind("<Leave>", self._on_canvas_leave)
+
+        ### Fill visible option rows ###
+        self._repopulate_visible()
+
+        # Focus out binding to close the popup when the app itself loses focus (debounced, focus returning within 50ms cancels the close)
+        self.popup.bind("<FocusOut>", self._on_popup_focus_out)
+        self.popup.bind("<FocusIn>", self._on_popup_focus_in)
+
+    def _create_row(self) -> dict:
+        """
+        Private Method
+
+        Creates one recyclable option row as hidden canvas items (a background rectangle and a text item). Returns the row slot dict.
+        Rows are drawn by the canvas itself rather than as widgets, both items share a per-slot tag so they can be moved and hidden together.
+        """
+        tag = f"row{len(self._row_pool)}"
+        background = self.canvas.create_rectangle(0, 0, self.width, ROW_HEIGHT,
+                                                  fill=self.dropdown_bg_color, outline="", state="hidden", tags=(tag,))
+        # Uses measure_font so rendered widths match the truncation measurements
+        text = self.canvas.create_text(10, ROW_HEIGHT // 2, text="", anchor="w",
+                                       font=self.measure_font, fill=self.text_color, state="hidden", tags=(tag,))
+        return {"tag": tag, "bg": background, "txt": text, "idx": None, "text": "", "y": 0, "selected": False, "hidden": True}
+
+    def _repopulate_visible(self) -> None:
+        """
+        Private Method
 
-        ### Create option rows with checkboxes and labels ###
+        Points the recycled row slots at the options currently in the canvas viewport, updating their text, position and selection visuals.
+        """
+        num_options = len(self.options)
+        first = int(self.canvas.yview()[0] * ROW_HEIGHT * num_options) // ROW_HEIGHT # first (partially) visible option index
+
+        # Grow the pool to cover the viewport (plus one partially visible row), or drop slots the shorter list no longer needs
+        pool_size = min(num_options, math.ceil(self.dropdown_height / ROW_HEIGHT) + 1)
+        while len(self._row_pool) < pool_size:
+            self._row_pool.append(self._create_row())
+        while len(self._row_pool) > pool_size:
+            self.canvas.delete(self._row_pool.pop()["tag"])
+
+        self._visible_rows = {}
+        self._hover_idx = None # rows moved under the pointer, re-evaluate the tooltip on the next motion
+        for offset, slot in enumerate(self._row_pool):
+            idx = first + offset
+            if idx >= num_options: # spare slot, nothing to display
+                slot["idx"] = None
+                if not slot["hidden"]:
+                    slot["hidden"] = True
+                    self.canvas.itemconfigure(slot["tag"], state="hidden")
+                continue
+
+            truncated_text = self._get_display_text(idx)
+            slot["idx"] = idx
+
+            # Reuse the slot's widgets, only reconfiguring what actually changed
+            if slot["text"] != truncated_text:
+                slot["text"] = truncated_text
+                self.canvas.itemconfigure(slot["txt"], text=truncated_text)
+            if slot["y"] != idx * ROW_HEIGHT: # shift both items of the row in one call
+                self.canvas.move(slot["tag"], 0, idx * ROW_HEIGHT - slot["y"])
+                slot["y"] = idx * ROW_HEIGHT
+            if slot["hidden"]:
+                slot["hidden"] = False
+                self.canvas.itemconfigure(slot["tag"], state="normal")
+
+            self._visible_rows[idx] = slot
+            self._paint_row(idx)
+
+    def _update_scrollregion(self) -> None:
+        """
+        Private Method
+
+        Sizes the canvas scrollregion from the option count (rows have a fixed height), instead of scanning items with bbox("all").
+        Skips the reconfigure if the option count is unchanged.
+        """
+        num_options = len(self.options)
+        if num_options != self._last_option_count:
+            self._last_option_count = num_options
+            self.canvas.configure(scrollregion=(0, 0, self.width, ROW_HEIGHT * num_options))
+
+    def _sync_display_text(self) -> None:
+        """
+        Private Method
+
+        Realigns the display text lists with self.options. Entries for options unchanged at the same index are kept,
+        changed or new ones are reset and truncated on demand by _get_display_text. Stripped option text is only recomputed for changed options.
+        """
+        prev = self._prev_options
+        display_text = [None] * len(self.options)
+        is_truncated = [False] * len(self.options)
+        stripped = [None] * len(self.options)
         for i, option in enumerate(self.options):
-            row_frame = tk.Frame(self.inner_frame, bg=self.dropdown_bg_color, width=self.width, height=40)
-            row_frame.pack(fill="x", anchor="w", pady=0)
-            row_frame.pack_propagate(False)
-
-            # Truncate text if necessary
-            max_label_width = self.width - 30
-            truncated_text = self._truncate_text(option, max_label_width, self.measure_font)
-
-            label = ctk.CTkLabel(row_frame,
-                                 text=truncated_text,
-                                 font=self.dropdown_font,
-                                 text_color=self.text_color,
-                                 anchor="w",
-                                 justify="left",
-                                 width=self.width - 20)
-            label.pack(side="left", fill="x", expand=True, padx=10, pady=0)
-
-            # Add tooltip if text was truncated
-            if truncated_text != option:
-                self._add_tooltip(label, option)
-
-            def toggle_selection(idx=i):
-                if idx in self.selected_indices:
-                    self.selected_indices.remove(idx)
-                else:
-                    self.selected_indices.add(idx)
-                self._update_option_visual(idx)
-                self._on_select()
+            if i < len(prev) and prev[i] == option:
+                display_text[i] = self._display_text[i]
+                is_truncated[i] = self._is_truncated[i]
+                stripped[i] = self._stripped_options[i]
+            else:
+                stripped[i] = option.strip()
+
+        self._prev_options = list(self.options)
+        self._display_text = display_text
+        self._is_truncated = is_truncated
+        self._stripped_options = stripped
 
-            # Bind click for selection
-            row_frame.bind("<Button-1>", lambda e, idx=i: toggle_selection(idx))
-            label.bind("<Button-1>", lambda e, idx=i: toggle_selection(idx))
+    def _get_display_text(self, idx) -> str:
+        """
+        Private Method
 
-            self.option_frames.append(row_frame)
-            self.option_labels.append(label)
+        Returns the label text for the option at idx, truncating (and storing) it on first request.
+        - idx (int): The index of the option. Integer as it represents the position of the option in the list.
+        """
+        text = self._display_text[idx]
+        if text is None:
+            option = self.options[idx]
+            text = self._display_text[idx] = self._truncate_text(option, self._max_label_width, self.measure_font)
+            self._is_truncated[idx] = text != option
+        return text
+
+    def _on_canvas_configure(self, event) -> None:
+        """
+        Private Method
 
-        # Focus out binding to close the popup
-        self.popup.bind("<FocusOut>", self._on_popup_focus_out)
+        Refills the visible rows when the canvas height changes. Width-only changes and repeated configure events are ignored,
+        since rows have a fixed width and only the viewport height decides which rows are visible.
+        - event (tk.Event): The configure event. Tkinter Event containing the canvas' new size.
+        """
+        if event.height != self._viewport_height:
+            self._viewport_height = event.height
+            self._schedule_repopulate()
+
+    def _on_canvas_scroll(self, first, last) -> None:
+        """
+        Private Method
+
+        Canvas yscrollcommand. Updates the scrollbar and refills the row slots for the new viewport.
+        - first (str): The top of the visible region as a fraction of the scrollregion. String as passed by Tk.
+        - last (str): The bottom of the visible region as a fraction of the scrollregion. String as passed by Tk.
+        """
+        self.scrollbar.set(first, last)
+        self._schedule_repopulate()
+
+    def _schedule_repopulate(self) -> None:
+        """
+        Private Method
+
+        Schedules a single _repopulate_visible on the next idle. Bursts of scroll/configure callbacks (e.g. fast wheel scrolling,
+        or a scrollregion change during refresh_options) collapse into one refill of the row slots.
+        """
+        if self._repopulate_after_id is None:
+            self._repopulate_after_id = self.after_idle(self._run_scheduled_repopulate)
+
+    def _run_scheduled_repopulate(self) -> None:
+        """
+        Private Method
+
+        Runs the refill scheduled by _schedule_repopulate.
+        """
+        self._repopulate_after_id = None
+        if self.canvas.winfo_exists():
+            self._repopulate_visible()
+
+    def _on_canvas_click(self, event) -> str:
+        """
+        Private Method
+
+        Single click dispatcher for all option rows. Resolves the clicked option index and toggles it.
+        - event (tk.Event): The click event. Tkinter Event containing information about the click.
+        """
+        idx = self._event_index(event)
+        if 0 <= idx < len(self.options):
+            self._toggle_selection(idx)
+        return "break"
+
+    def _event_index(self, event):
+        """
+        Private Method
+
+        Returns the option index under a click/motion event on the canvas, from the event's canvas y coordinate (rows have a fixed height).
+        - event (tk.Event): The pointer event. Tkinter Event containing the pointer position.
+        """
+        return int(self.canvas.canvasy(event.y) // ROW_HEIGHT)
+
+    def _toggle_selection(self, idx) -> None:
+        """
+        Private Method
+
+        Toggles selection of the option at the given index.
+        - idx (int): The index of the option to toggle. Integer as it represents the position of the option in the list.
+        """
+        if idx in self.selected_indices:
+            self.selected_indices.remove(idx)
+            del self._selected_sorted[bisect.bisect_left(self._selected_sorted, idx)]
+        else:
+            self.selected_indices.add(idx)
+            bisect.insort(self._selected_sorted, idx)
+        self._update_option_visual(idx)
+        self._on_select()
 
     def _update_option_visual(self, idx) -> None:
         """
         Private Method
 
-        Updates the appearance of the option at index idx based on whether it is selected.
+        Marks the option at index idx for a repaint on the next idle flush, so several toggles cost one batch of reconfigures.
+        Options without a row on screen are not queued, their row is painted from the selection when scrolled into view.
+        - idx (int): The index of the option to update. Integer as it represents the position of the option in the list.
+        """
+        if idx in self._visible_rows:
+            self._dirty_rows.add(idx)
+            self._schedule_visual_flush()
+
+    def _paint_row(self, idx) -> None:
+        """
+        Private Method
+
+        Updates the appearance of the option at index idx based on whether it is selected. Offscreen options are skipped,
+        they are painted when scrolled into view. Rows already showing the right state are not reconfigured.
         - idx (int): The index of the option to update. Integer as it represents the position of the option in the list.
         """
+        slot = self._visible_rows.get(idx)
+        if slot is None:
+            return
+
         selected = idx in self.selected_indices
-        frame = self.option_frames[idx]
-        label = self.option_labels[idx]
+        if slot["selected"] == selected: # already painted in this state
+            return
+        slot["selected"] = selected
 
         if selected:
-            frame.configure(bg=self.selected_bg_color)
-            label.configure(text_color=self.selected_text_color)
+            self.canvas.itemconfigure(slot["bg"], fill=self.selected_bg_color)
+            self.canvas.itemconfigure(slot["txt"], fill=self.selected_text_color)
         else:
-            frame.configure(bg=self.dropdown_bg_color)
-            label.configure(text_color=self.text_color)
+            self.canvas.itemconfigure(slot["bg"], fill=self.dropdown_bg_color)
+            self.canvas.itemconfigure(slot["txt"], fill=self.text_color)
 
     def _bind_mousewheel(self) -> None:
         """
         Private Method
 
-        Enables mouse wheel scrolling for the dropdown canvas.
+        Enables mouse wheel scrolling for the dropdown canvas. Bound once on the popup window, so wheel events elsewhere in the app
+        never reach this handler and the popup's own widgets (canvas and rows) all scroll the list.
         """
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
+        # Separate handlers per event, the scroll direction of Button-4/5 (X11) is known when binding
+        self._wheel_steps = 0 # wheel units accumulated since the last scroll, see _queue_wheel_steps
+        self._wheel_after_id = None
+        self.popup.bind("<MouseWheel>", self._on_mousewheel)
+        self.popup.bind("<Button-4>", self._on_wheel_up)
+        self.popup.bind("<Button-5>", self._on_wheel_down)
 
-    def _unbind_mousewheel(self) -> None:
+    def _on_mousewheel(self, event) -> None:
         """
         Private Method
 
-        Disables mouse wheel scrolling for the dropdown canvas.
+        Handles <MouseWheel> scroll events (Windows/macOS) for the dropdown canvas.
+        - event (tk.Event): The mouse wheel event. Tkinter Event containing information about the scroll.
         """
-        self.canvas.unbind_all("<MouseWheel>")
-        self.canvas.unbind_all("<Button-4>")
-        self.canvas.unbind_all("<Button-5>")
+        if event.delta:
+            self._queue_wheel_steps(-1 if event.delta > 0 else 1)
 
-    def _on_mousewheel(self, event) -> None:
+    def _on_wheel_up(self, event) -> None:
         """
         Private Method
 
-        Handles mouse wheel scroll events for the dropdown canvas.
+        Handles <Button-4> (X11 wheel up) by scrolling the dropdown canvas up one unit.
         - event (tk.Event): The mouse wheel event. Tkinter Event containing information about the scroll.
         """
-        if event.num == 4 or event.delta > 0:
-            self.canvas.yview_scroll(-1, "units")
-        elif event.num == 5 or event.delta < 0:
-            self.canvas.yview_scroll(1, "units")
+        self._queue_wheel_steps(-1)
+
+    def _on_wheel_down(self, event) -> None:
+        """
+        Private Method
+
+        Handles <Button-5> (X11 wheel down) by scrolling the dropdown canvas down one unit.
+        - event (tk.Event): The mouse wheel event. Tkinter Event containing information about the scroll.
+        """
+        self._queue_wheel_steps(1)
+
+    def _queue_wheel_steps(self, steps: int) -> None:
+        """
+        Private Method
+
+        Accumulates wheel ticks and scrolls the canvas once on the next idle, so a burst of ticks costs one yview_scroll
+        (and one scroll callback/row refill) instead of one per tick.
+        - steps (int): The number of units to scroll (negative scrolls up). Integer as it represents the scroll distance in units.
+        """
+        self._wheel_steps += steps
+        if self._wheel_after_id is None:
+            self._wheel_after_id = self.after_idle(self._apply_wheel_steps)
+
+    def _apply_wheel_steps(self) -> None:
+        """
+        Private Method
+
+        Scrolls the canvas by the wheel ticks accumulated since the last idle.
+        """
+        steps, self._wheel_steps = self._wheel_steps, 0
+        self._wheel_after_id = None
+        if steps and self.canvas.winfo_exists():
+            self.canvas.yview_scroll(steps, "units")
 
     def _toggle_menu(self, event=None) -> None:
         """
@@ -335,24 +610,87 @@ class MultiSelectComboBox(ctk.CTkFrame):
         """
         Private Method
 
-        Displays the dropdown menu and focuses the popup.
+        Displays the dropdown menu and focuses the popup, building the popup on first open.
         """
+        self._ensure_popup()
         x = self.winfo_rootx()
         y = self.winfo_rooty() + self.winfo_height()
-        self.popup.geometry(f"{self.width}x{self.dropdown_height}+{x}+{y}")
+        geometry = f"{self._popup_geom_size}+{x}+{y}"
+        if geometry != self._last_popup_geometry: # skip the wm geometry call (and window manager move) if the popup would not change
+            self._last_popup_geometry = geometry
+            self.popup.geometry(geometry)
         self.popup.deiconify()
         self.popup.focus_set()
         self.popup.bind("<Return>", self._on_enter_press)
         self.is_menu_open = True
+        self._bind_outside_click()
         self.dropdown_icon.configure(text="▲")
 
+    def _ensure_popup(self) -> None:
+        """
+        Private Method
+
+        Makes sure the popup exists. It is built once, on first open, and then reused for the widget's lifetime: hiding only withdraws it.
+        If it has been destroyed externally it is rebuilt (it is a child of this widget, so it is destroyed along with it).
+        """
+        if self.popup is None or not self.popup.winfo_exists():
+            self._last_popup_geometry = None # a new popup has no geometry applied yet
+            self._create_menu_popup()
+
+    def _bind_outside_click(self) -> None:
+        """
+        Private Method
+
+        Binds the outside-click close handler on this widget's toplevel window while the menu is open (the popup is its own toplevel, so clicks in it never arrive).
+        Bound to the button release, which reaches the toplevel even when the pressed widget's own <Button-1> handler returns "break".
+        Added alongside (add="+") any other binding on the window and never consumes the event, so the click still reaches its target.
+        """
+        if self._outside_click_id is None:
+            self._outside_click_id = self.winfo_toplevel().bind("<ButtonRelease-1>", self._on_outside_click, add="+")
+
+    def _unbind_outside_click(self) -> None:
+        """
+        Private Method
+
+        Removes the outside-click handler bound by _bind_outside_click, leaving any other <ButtonRelease-1> binding on the toplevel in place.
+        """
+        if self._outside_click_id is None:
+            return
+        funcid, self._outside_click_id = self._outside_click_id, None
+        toplevel = self.winfo_toplevel()
+        # Misc.unbind(sequence, funcid) clears every binding for the sequence (before Python 3.13), so only this handler's line is dropped
+        script = toplevel.bind("<ButtonRelease-1>")
+        kept = "\n".join(line for line in script.split("\n") if funcid not in line)
+        toplevel.tk.call("bind", toplevel._w, "<ButtonRelease-1>", kept)
+        toplevel.deletecommand(funcid)
+
+    def _on_outside_click(self, event) -> None:
+        """
+        Private Method
+
+        Closes the menu when a click in this widget's window lands outside the combobox. The click is not consumed, so it still reaches its target.
+        Clicks on the combobox itself are ignored, its own bindings already toggle the menu.
+        - event (tk.Event): The button release event. Tkinter Event containing the clicked widget.
+        """
+        if not self.is_menu_open:
+            return
+        path, container = str(event.widget), str(self.main_container)
+        if path == container or path.startswith(container + "."):
+            return
+        self._hide_menu()
+
     def _hide_menu(self) -> None:
         """
         Private Method
 
-        Hides the dropdown menu and updates state.
+        Hides the dropdown menu and updates state. Does nothing if the menu is already closed, so the close callback runs once per close.
         """
+        self._cancel_pending_hide()
+        if not self.is_menu_open:
+            return
+        self._unbind_outside_click()
         self.popup.withdraw()
+        self._hide_tooltip() # the shared tooltip belongs to the root window, so it does not hide with the popup
         self.is_menu_open = False
         self.dropdown_icon.configure(text="▼")
 
@@ -371,101 +709,267 @@ class MultiSelectComboBox(ctk.CTkFrame):
         """
         Private Method
 
-        Handles popup losing focus (closes menu).
+        Handles popup losing focus, e.g. switching to another application (closes menu after 50ms). Focus is briefly lost during clicks on some window managers,
+        so the close is deferred and cancelled by _on_popup_focus_in if focus comes back.
         - event (tk.Event): The event that triggered the focus out. Tkinter Event containing information about the focus event.
         """
-        if self.is_menu_open:
-            self._hide_menu()
+        if self.is_menu_open and self._pending_hide is None:
+            self._pending_hide = self.after(50, self._hide_menu)
+
+    def _on_popup_focus_in(self, event=None) -> None:
+        """
+        Private Method
+
+        Handles popup regaining focus, cancelling a close scheduled by _on_popup_focus_out.
+        - event (tk.Event): The event that triggered the focus in. Tkinter Event containing information about the focus event.
+        """
+        self._cancel_pending_hide()
+
+    def _cancel_pending_hide(self) -> None:
+        """
+        Private Method
+
+        Cancels the pending focus-out close, if any.
+        """
+        if self._pending_hide is not None:
+            self.after_cancel(self._pending_hide)
+            self._pending_hide = None
+
+    def destroy(self) -> None:
+        """
+        Public Method
+
+        Destroys the widget, first removing its outside-click handler from the toplevel (it would otherwise outlive the widget's Tcl commands).
+        """
+        self._unbind_outside_click()
+        super().destroy()
 
     def _on_select(self) -> None:
         """
         Private Method
 
         Updates selection state, visual feedback, and toggles checkboxes as needed.
+        Checkbox variables update immediately, widget reconfigures are deferred to a single idle flush that applies only the net change.
+        Checkbox state only changes when the selection count crosses zero, so toggles between non-zero counts only update the label text.
         """
         count = len(self.selected_indices)
+        prev_count, self._last_selected_count = self._last_selected_count, count
 
         # Update label text
-        if count == 0:
-            self.selected_text_var.set(self.default_text)
-        elif count == 1:
-            self.selected_text_var.set("1 tag selected...")
-        else:
-            self.selected_text_var.set(f"{count} tags selected...")
+        text = self._selected_label(count)
+
+        # Merge into any state still waiting for the flush, so a boundary crossing queued by an earlier toggle is kept
+        pending = self._pending_visual_state or {}
+        pending["text"] = text
 
         # Enable or disable the checkbox
+        if (prev_count == 0) != (count == 0):
+            if count == 0:
+                # Disable require checkbox if no tags selected, enable "None" checkbox
+                self.require_all_var.set(False)  # optional: uncheck when disabled
+                pending["require_state"], pending["none_state"] = "disabled", "normal"
+
+            else: # count > 0
+                # Enable require checkbox if any tags selected, disable "None" checkbox
+                self.no_tags_var.set(False)  # optional: uncheck when disabled
+                pending["require_state"], pending["none_state"] = "normal", "disabled"
+
+        self._pending_visual_state = pending
+        self._schedule_visual_flush()
+
+    def _selected_label(self, count: int) -> str:
+        """
+        Private Method
+
+        Returns the main label text for the given selection count, using the pre-built strings where available.
+        - count (int): The number of selected options. Integer as it represents the selection count.
+        """
         if count == 0:
-            # Disable require checkbox if no tags selected
-            self.require_checkbox.configure(state="disabled")
-            self.require_all_var.set(False)  # optional: uncheck when disabled
+            return self.default_text
+        if count < len(self._SELECTED_LABELS):
+            return self._SELECTED_LABELS[count]
+        return f"{count} tags selected..."
+
+    def _schedule_visual_flush(self) -> None:
+        """
+        Private Method
+
+        Schedules _flush_visual_state for the next idle moment, unless already scheduled.
+        """
+        if not self._pending_refresh:
+            self._pending_refresh = True
+            self.after_idle(self._flush_visual_state)
+
+    def _flush_visual_state(self) -> None:
+        """
+        Private Method
 
-            # Enable "None" checkbox if no tags selected
-            self.no_tags_checkbox.configure(state="normal")
-            self.no_tags_label.configure(text_color='white')
+        Applies pending label/checkbox state and repaints dirty option rows, reconfiguring only widgets whose value changed.
+        """
+        self._pending_refresh = False
+
+        pending = self._pending_visual_state
+        if pending is not None:
+            self._pending_visual_state = None
+            if self.selected_text_var.get() != pending["text"]:
+                self.selected_text_var.set(pending["text"])
+            if "require_state" in pending: # only present when the selection count crossed zero
+                self._set_require_state(pending["require_state"])
+                self._set_none_state(pending["none_state"])
+
+        dirty_rows, self._dirty_rows = self._dirty_rows, set()
+        for idx in dirty_rows:
+            self._paint_row(idx)
+
+    def _set_require_state(self, state: str) -> None:
+        """
+        Private Method
 
-        else: # count > 0
-            # Enable require checkbox if any tags selected
-            self.require_checkbox.configure(state="normal")
+        Sets the "Require all tags?" checkbox state if it differs from the current one.
+        - state (str): The checkbox state ("normal" or "disabled"). String as it represents the Tk widget state.
+        """
+        if self._current_visual_state["require_state"] != state:
+            self._current_visual_state["require_state"] = state
+            if self.popup is not None: # otherwise applied when the popup is built
+                self.require_checkbox.configure(state=state)
 
-            # Disable "None" checkbox if any tags selected
-            self.no_tags_checkbox.configure(state="disabled")
-            self.no_tags_var.set(False)  # optional: uncheck when disabled
-            self.no_tags_label.configure(text_color="#9FA69C")
+    def _set_none_state(self, state: str) -> None:
+        """
+        Private Method
 
+        Sets the "None" checkbox state and label colour if they differ from the current ones.
+        - state (str): The checkbox state ("normal" or "disabled"). String as it represents the Tk widget state.
+        """
+        if self._current_visual_state["none_state"] != state:
+            self._current_visual_state["none_state"] = state
+            if self.popup is None: # applied when the popup is built
+                return
+            self.no_tags_checkbox.configure(state=state)
+            self.no_tags_label.configure(text_color='white' if state == "normal" else "#9FA69C")
 
     def _truncate_text(self, text: str, max_width_px: int, font) -> str:
         """
         Private Method
 
         Truncates text with ellipsis if it exceeds max_width_px in the given font. Returns string text either regular or truncated with ellipsis.
+        Widths are estimated from cached per-character widths and only measured exactly by Tk near the cutoff, results are memoised per text.
         - text (str): The text to truncate. String as it represents the content to be displayed.
         - max_width_px (int): The maximum width of the text to be truncated. Integer as it represents the width in pixels.
         - font (CTkFont): The font used for measuring text width. CTkFont as it represents the text styling.
         """
-        ellipsis = "..."
-        ellipsis_width = font.measure(ellipsis)
+        key = (text, max_width_px)
+        cached = self._truncate_cache.get(key)
+        if cached is not None:
+            return cached
 
-        if font.measure(text) <= max_width_px:
+        ellipsis = "..."
+        ellipsis_width = self._ellipsis_width
+        if ellipsis_width is None:
+            ellipsis_width = self._ellipsis_width = self._measure(ellipsis, font)
+
+        # Prefix sums of estimated character widths (prefix[i] is the estimated width of text[:i])
+        prefix = [0]
+        for char in text:
+            width = self._char_widths.get(char)
+            if width is None:
+                width = self._char_widths[char] = font.measure(char)
+            prefix.append(prefix[-1] + width)
+
+        # Fits if clearly under the limit, measure exactly only when the estimate is within 3px of it
+        if prefix[-1] < max_width_px - 3 or (prefix[-1] <= max_width_px + 3 and self._measure(text, font) <= max_width_px):
+            self._truncate_cache[key] = text
             return text
 
-        for i in range(len(text), 0, -1):
-            sub_text = text[:i]
-            if font.measure(sub_text) + ellipsis_width <= max_width_px:
-                return sub_text + ellipsis
-
-        return ellipsis  # fallback if even a single char is too wide
+        # Largest prefix whose estimated width plus ellipsis fits, then correct with exact measures near the cutoff
+        i = bisect.bisect_right(prefix, max_width_px - ellipsis_width) - 1
+        if i > 0 and self._measure(text[:i], font) + ellipsis_width > max_width_px:
+            # Estimate was too generous, binary search the exact cutoff below it (O(log n) Tk measures instead of stepping back one char at a time)
+            lo, hi = 0, i - 1
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if self._measure(text[:mid], font) + ellipsis_width <= max_width_px:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            i = lo
 
+        result = text[:i] + ellipsis if i > 0 else ellipsis # fallback if even a single char is too wide
+        self._truncate_cache[key] = result
+        return result
 
-    def _add_tooltip(self, widget, text) -> None:
+    def _measure(self, text: str, font) -> int:
         """
         Private Method
 
-        Adds a tooltip to the given widget displaying the full text when hovered.
-        - widget (CTk/Tk): The widget to attach the tooltip to. CTk/Tk as it represents the UI element which the tooltip will be attached to.
-        - text (str): The text to display in the tooltip. String as it represents the content to be shown.
+        Returns the exact pixel width of text in the given font, caching the result to avoid repeated Tk round-trips.
+        - text (str): The text to measure. String as it represents the content to be displayed.
+        - font (CTkFont): The font used for measuring text width. CTkFont as it represents the text styling.
+        """
+        width = self._measure_cache.get(text)
+        if width is None:
+            width = self._measure_cache[text] = font.measure(text)
+        return width
+
+    def _on_canvas_motion(self, event) -> None:
         """
-        tooltip = tk.Toplevel(widget)
-        tooltip.withdraw()
-        tooltip.overrideredirect(True)
-        label = tk.Label(tooltip, text=text, bg="#CDE8C0", fg=self.text_color, padx=6, pady=2)
-        label.pack()
+        Private Method
 
-        def show_tooltip(event):
-            """
-            Show tooltip near the widget when hovered.
-            """
-            tooltip.geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
-            tooltip.deiconify()
+        Delegated tooltip handler. Shows the full option text near the pointer while hovering a truncated option, hides it otherwise.
+        - event (tk.Event): The motion event. Tkinter Event containing information about the pointer position.
+        """
+        idx = self._event_index(event)
+        if idx == self._hover_idx:
+            return
+        self._hover_idx = idx
+
+        if not (idx in self._visible_rows and self._is_truncated[idx]): # not over a truncated option
+            self._hide_tooltip()
+            return
+        text = self.options[idx]
+
+        tooltip = self._get_tooltip()
+        MultiSelectComboBox._tooltip_owner = self
+        MultiSelectComboBox._shared_tooltip_label.configure(text=text, fg=self.text_color)
+        tooltip.geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
+        tooltip.deiconify()
+        tooltip.lift() # above this combobox's popup, which may have been created after the tooltip
+
+    def _get_tooltip(self) -> tk.Toplevel:
+        """
+        Private Method
 
-        def hide_tooltip(event):
-            """
-            Hide tooltip when mouse leaves the widget.
-            """
+        Returns the tooltip window shared by all MultiSelectComboBoxes, building it (parented to the root window) on first use.
+        """
+        tooltip = MultiSelectComboBox._shared_tooltip
+        if tooltip is None or not tooltip.winfo_exists():
+            tooltip = tk.Toplevel(self._root())
             tooltip.withdraw()
+            tooltip.overrideredirect(True)
+            label = tk.Label(tooltip, text="", bg="#CDE8C0", fg=self.text_color, padx=6, pady=2)
+            label.pack()
+            MultiSelectComboBox._shared_tooltip = tooltip
+            MultiSelectComboBox._shared_tooltip_label = label
+        return tooltip
+
+    def _on_canvas_leave(self, event=None) -> None:
+        """
+        Private Method
+
+        Hides the tooltip once the pointer leaves the canvas.
+        - event (tk.Event): The leave event. Tkinter Event containing information about the pointer position.
+        """
+        self._hover_idx = None
+        self._hide_tooltip()
+
+    def _hide_tooltip(self) -> None:
+        """
+        Private Method
 
-        # Bind hover events to show/hide tooltip when entering/leaving the widget
-        widget.bind("<Enter>", show_tooltip)
-        widget.bind("<Leave>", hide_tooltip)
+        Hides the shared tooltip window if this combobox is the one showing it.
+        """
+        if MultiSelectComboBox._tooltip_owner is self:
+            MultiSelectComboBox._tooltip_owner = None
+            MultiSelectComboBox._shared_tooltip.withdraw()
 
     def _on_enter_press(self, event=None) -> None:
         """
@@ -483,7 +987,8 @@ class MultiSelectComboBox(ctk.CTkFrame):
 
         Returns a list of selected options as strings.
         """
-        return [self.options[i].strip() for i in sorted(self.selected_indices)]
+        stripped = self._stripped_options
+        return [stripped[i] for i in self._selected_sorted]
 
     def require_all_selected(self) -> bool:
         """
@@ -499,85 +1004,44 @@ class MultiSelectComboBox(ctk.CTkFrame):
 
         Resizes the dropdown box if needed, refreshes the option list in the dropdown, preserving previous selection.
         """
-        # Dynamically resize the dropdown height based on number of options
-        numOptions = max(1, len(self.options))
-        if numOptions < 5:
-            self.dropdown_height = 40 * numOptions + 25
-        else:  # Max height for 5 rows displayed
-            self.dropdown_height = 200 + 25
-
-        # Save current selected tags (indices)
-        preserved_indices = set(self.selected_indices)
+        # Dynamically resize the dropdown height based on number of options (canvas only reconfigured if it changed)
+        dropdown_height = self._compute_dropdown_height(len(self.options))
+        if dropdown_height != self.dropdown_height:
+            self.dropdown_height = dropdown_height
+            self._popup_geom_size = f"{self.width}x{dropdown_height}"
+            if self.canvas is not None:
+                self.canvas.configure(height=dropdown_height)
+
+        # Save current "require all" state and drop selections past the end of the new option list
         preserved_require_all = self.require_all_var.get()
+        self.selected_indices.intersection_update(range(len(self.options)))
+        # Resync the ordered copy and count, since selected_indices may also have been changed directly (e.g. cleared) before refreshing
+        self._selected_sorted = sorted(self.selected_indices)
+        self._last_selected_count = len(self.selected_indices)
+
+        # Resize the scrollable area and refill the existing visible rows with the new options.
+        # Row widgets are reused rather than destroyed and recreated, unchanged rows are left untouched.
+        # Before the popup is first built only the display lists are realigned, the rows are filled when it is created.
+        self._sync_display_text()
+        if self.canvas is not None:
+            self._update_scrollregion()
+            self._repopulate_visible()
 
-        # Clear visual dropdown content
-        for frame in self.option_frames:
-            frame.destroy()
-        self.option_frames.clear()
-        self.option_labels.clear()
-
-        # Rebuild dropdown with new options
-        for i, option in enumerate(self.options):
-            row_frame = tk.Frame(self.inner_frame, bg=self.dropdown_bg_color, width=self.width, height=40)
-            row_frame.pack(fill="x", anchor="w", pady=0)
-            row_frame.pack_propagate(False)
-
-            # Truncate text if necessary
-            max_label_width = self.width - 25
-            truncated_text = self._truncate_text(option, max_label_width, self.measure_font)
-
-            label = ctk.CTkLabel(row_frame,
-                                 text=truncated_text,
-                                 font=self.dropdown_font,
-                                 text_color=self.text_color,
-                                 anchor="w",
-                                 justify="left",
-                                 width=self.width - 20)
-            label.pack(side="left", fill="x", expand=True, padx=10, pady=0)
-
-            # Add tooltip if text was truncated
-            if truncated_text != option:
-                self._add_tooltip(label, option)
-
-            def toggle_selection(idx=i):
-                """
-                Toggle selection of the option at the given index.
-                """
-                if idx in self.selected_indices:
-                    self.selected_indices.remove(idx)
-                else:
-                    self.selected_indices.add(idx)
-                self._update_option_visual(idx)
-                self._on_select()
-
-            # Bind click for selection
-            row_frame.bind("<Button-1>", lambda e, idx=i: toggle_selection(idx))
-            label.bind("<Button-1>", lambda e, idx=i: toggle_selection(idx))
-
-            self.option_frames.append(row_frame)
-            self.option_labels.append(label)
-
-            # Restore selection visuals if tag was selected before
-            if i < len(self.options) and i in preserved_indices:
-                self.selected_indices.add(i)
-                self._update_option_visual(i)
-
-        # Restore state of require all checkbox
+        # Restore state of both checkboxes (superseding any label/checkbox update still waiting for the idle flush)
+        self._pending_visual_state = None
         if self.selected_indices:
-            self.require_checkbox.configure(state="normal")
+            self._set_require_state("normal")
+            self._set_none_state("disabled")
             self.require_all_var.set(preserved_require_all)
 
-            count = len(self.selected_indices)
-            if count == 0:
-                self.selected_text_var.set(self.default_text)
-            elif count == 1:
-                self.selected_text_var.set("1 tag selected...")
-            else:
-                self.selected_text_var.set(f"{count} tags selected...")
+            text = self._selected_label(len(self.selected_indices))
         else:
-            self.require_checkbox.configure(state="disabled")
+            self._set_require_state("disabled")
+            self._set_none_state("normal")
             self.require_all_var.set(False)
-            self.selected_text_var.set(self.default_text)
+            text = self.default_text
+        if self.selected_text_var.get() != text: # skip the variable trace (and label redraw) if unchanged
+            self.selected_text_var.set(text)
     
     def reset_scroll(self) -> None:
         """
@@ -6,8 +6,9 @@ Purpose:
     supporting both enter key search and clickable icon activation. The icon visually reacts to hover and search events.
 
 Contains:
-    - SearchBarWithIcon class: A CTkFrame-based widget containing a search entry and a clickable/hoverable icon.
+    - SearchBarWithIcon class: A rounded CTkFrame-based widget containing a search entry and a clickable/hoverable icon.
     - Methods for getting/setting/clearing the search text, handling search actions, and updating icon appearance.
+    - Padded default icon so hovering only swaps the image, without moving the icon button.
 
 Naming Conventions:
     - Class names: PascalCase (SearchBarWithIcon)
@@ -24,8 +25,15 @@ Usage:
 
 ### Module Imports ###
 import customtkinter as ctk
+from PIL import Image
+
+### Local Class Imports ###
+from classes.widgets.image_cache import get_ctk_image
 
 class SearchBarWithIcon(ctk.CTkFrame):
+    # Padded default icons keyed by id of PIL image, stored with their source image so ids are not reused
+    _padded_cache: dict[int, tuple[Image.Image, ctk.CTkImage]] = {}
+
     def __init__(self, master, *,
                  width: int = 500,
                  height: int = 50,
@@ -58,35 +66,35 @@ class SearchBarWithIcon(ctk.CTkFrame):
         - icon_width (int): The width of the search icon. Integer as it represents the width in pixels.
         - on_search_callback (callable): The callback function to call when the search is triggered. Callable as it represents a callback function.
         """
-        super().__init__(master, width=width, height=height, fg_color="transparent", **kwargs)
+        ### Rounded Box ###
+        # The widget itself is the rounded box (no transparent wrapper frame around it)
+        super().__init__(master,
+                         width=width,
+                         height=height,
+                         corner_radius=corner_radius,
+                         fg_color=fg_color,
+                         border_width=border_width,
+                         **kwargs)
         ### Appearance ###
         self.width = width
         self.height = height
         self.icon_width = icon_width
+        # Icon position, fixed for the widget's lifetime. The button sits where the (2px larger) hover icon is drawn,
+        # the default icon carries its 1px offset as transparent padding (see _get_padded_icon_image)
+        self._icon_y = (self.height - (self.height - 2)) // 2 + 5
+        self._icon_x = self.width - self.icon_width - 26
+        self._icon_state = "default" # icon currently shown ("default" or "hover"), used to skip redundant reconfigures
+        self._hover_after_id = None # pending icon restore after a search (only one is ever queued)
 
         self.on_search_callback = on_search_callback # callback for search action
 
         self.pack_propagate(False)
 
-        ### Outer Fake Box (Rounded) ###
-        self.fake_box = ctk.CTkFrame(self,
-                                     width=width,
-                                     height=height-3,
-                                     corner_radius=corner_radius,
-                                     fg_color=fg_color,
-                                     border_width=border_width)
-        self.fake_box.pack(fill="both", expand=True)
-        self.fake_box.pack_propagate(False)
-
-        ### Internal container ###
-        self.inner_frame = ctk.CTkFrame(self.fake_box, fg_color=fg_color)
-        self.inner_frame.pack(side="left", fill="both", expand=True, padx=(25, 70),pady=1)  # right pad keeps away from edge
-        self.inner_frame.pack_propagate(False)
-
         ### Search Entry (Reduced Width to For Icon) ###
-        self.search_entry = ctk.CTkEntry(self.inner_frame,
+        # Packed straight into the box (no intermediate CTkFrame), the padding keeps it clear of the rounded edge and the icon
+        self.search_entry = ctk.CTkEntry(self,
                                          placeholder_text=entry_placeholder,
-                                         width=width - self.icon_width - 10,  # subtract icon width and a bit extra for spacing
+                                         width=width - self.icon_width - 35,  # subtract icon width and the left/right padding
                                          height=height - 13,
                                          corner_radius=0,
                                          font=font,
@@ -95,13 +103,14 @@ class SearchBarWithIcon(ctk.CTkFrame):
                                          fg_color=fg_color,
                                          border_width=0,
                                          justify='left')
-        self.search_entry.pack(side="left", fill="y", pady=(0, 6))
+        self.search_entry.pack(side="left", fill="y", padx=(25, 70), pady=(1, 7))  # right pad keeps away from edge
 
         ### Icon Button Setup ###
-        self.icon_image_default = ctk.CTkImage(light_image=icon, dark_image=icon, size=(38,38))
-        self.icon_image_hover = ctk.CTkImage(light_image=icon_hover, dark_image=icon_hover, size=(40,40))
+        self.icon_image_default = SearchBarWithIcon._get_padded_icon_image(icon)
+        self.icon_image_hover = None # built on first hover by _get_hover_image, as CTkImage resizes its image straight away
+        self._icon_hover_src = icon_hover
 
-        self.icon_button = ctk.CTkButton(self.fake_box,
+        self.icon_button = ctk.CTkButton(self,
                                          image=self.icon_image_default,
                                          text="",
                                          fg_color=fg_color,
@@ -110,7 +119,7 @@ class SearchBarWithIcon(ctk.CTkFrame):
                                          height=self.icon_width,
                                          command=self._on_icon_click,
                                          hover_color=fg_color)
-        self.icon_button.place(x=self.width - self.icon_width - 25, y=(self.height - (self.height - 2)) // 2 + 5)
+        self.icon_button.place(x=self._icon_x, y=self._icon_y) # placed once, hovering only swaps the image
 
         ### Bind events for icon hover and search entry ###
         self.icon_button.bind("<Enter>", self._on_hover_enter)
@@ -122,20 +131,23 @@ class SearchBarWithIcon(ctk.CTkFrame):
         Private Method
 
         Handles icon button click event, triggers search callback, and updates icon appearance.
+        Focus is only moved off the entry if the entry actually has it (clicking the icon does not take focus).
         """
         if self.on_search_callback:
             self.on_search_callback(self.get())
 
         self._on_hover_leave(event)
 
-        self.after(100, lambda: self._on_hover_enter(event))
-        self.search_entry.master.focus_set()
+        self._schedule_icon_restore(self._restore_icon_hover)
+        if self.focus_get() is self.search_entry._entry:
+            self.search_entry.master.focus_set()
     
     def _on_enter_press(self, event=None) -> None:
         """
         Private Method
 
         Handles Enter key press in search entry, triggers search callback, and updates icon appearance.
+        The entry always has focus here (it received the key press), so focus is moved off it without checking.
         - event (tk.Event): The event object associated with the key press. Tkinter Event so it can be used to identify the widget that triggered the enter press event.
         """
         if self.on_search_callback:
@@ -143,28 +155,91 @@ class SearchBarWithIcon(ctk.CTkFrame):
 
         self._on_hover_enter(event)
 
-        self.after(100, lambda: self._on_hover_leave(event))
+        self._schedule_icon_restore(self._restore_icon_default)
         self.search_entry.master.focus_set()
 
+    def _schedule_icon_restore(self, restore: callable) -> None:
+        """
+        Private Method
+
+        Schedules the icon to be restored 100ms after a search, replacing any restore still pending so repeated searches queue a single timer.
+        - restore (callable): The bound method restoring the icon (_restore_icon_hover or _restore_icon_default). Callable as it represents the scheduled task.
+        """
+        if self._hover_after_id is not None:
+            self.after_cancel(self._hover_after_id)
+        self._hover_after_id = self.after(100, restore)
+
+    def _restore_icon_hover(self) -> None:
+        """
+        Private Method
+
+        Returns the icon to its hover image after an icon click (the pointer is still over the icon).
+        """
+        self._hover_after_id = None
+        self._on_hover_enter(None)
+
+    def _restore_icon_default(self) -> None:
+        """
+        Private Method
+
+        Returns the icon to its default image after an Enter key search.
+        """
+        self._hover_after_id = None
+        self._on_hover_leave(None)
+
     def _on_hover_enter(self, event) -> None:
         """
         Private Method
 
-        Handles mouse entering icon button, updates icon to hover image.
+        Handles mouse entering icon button, updates icon to hover image. Does nothing if the hover icon is already shown.
         - event (tk.Event): The event object associated with the mouse enter event. Tkinter Event so it can be used to identify the widget that triggered the hover event.
         """
-        self.icon_button.configure(image=self.icon_image_hover)
-        self.icon_button.place(x=self.width - self.icon_width - 26, y=(self.height - (self.height - 2)) // 2 + 5)
+        if self._icon_state == "hover":
+            return
+        self._icon_state = "hover"
+        self.icon_button.configure(image=self._get_hover_image())
+
+    @classmethod
+    def _get_padded_icon_image(cls, icon) -> ctk.CTkImage:
+        """
+        Private Class Method
+
+        Returns the shared 40x40 CTkImage of the default icon: the icon at 38x38, offset 2px right and 1px down on a transparent canvas.
+        This matches where the icon used to be placed relative to the 40x40 hover icon, so hovering needs no button move.
+        The padding is added at the source image's resolution, so the icon stays sharp when CTk scales it.
+        - icon (Image): The default icon image. Image as it represents the icon image.
+        """
+        cached = cls._padded_cache.get(id(icon))
+        if cached is not None:
+            return cached[1]
+        w, h = icon.size
+        padded = Image.new("RGBA", (round(w * 40 / 38), round(h * 40 / 38)), (0, 0, 0, 0))
+        padded.paste(icon.convert("RGBA"), (round(w * 2 / 38), round(h / 38)))
+        img = ctk.CTkImage(light_image=padded, dark_image=padded, size=(40,40))
+        cls._padded_cache[id(icon)] = (icon, img)
+        return img
+
+    def _get_hover_image(self) -> ctk.CTkImage:
+        """
+        Private Method
+
+        Returns the hover icon CTkImage, creating it on first use.
+        """
+        if self.icon_image_hover is None:
+            self.icon_image_hover = get_ctk_image(self._icon_hover_src, (40,40))
+        return self.icon_image_hover
 
     def _on_hover_leave(self, event) -> None:
         """
         Private Method
 
-        Handles mouse leaving icon button, returns icon to default image.
+        Handles mouse leaving icon button, returns icon to default image. Does nothing if the default icon is already shown.
         - event (tk.Event): The event object associated with the mouse leave event. Tkinter Event so it can be used to identify the widget that triggered the hover event.
         """
+        if self._icon_state == "default":
+            return
+        self._icon_state = "default"
         self.icon_button.configure(image=self.icon_image_default)
-        self.icon_button.place(x=self.width - self.icon_width - 25, y=(self.height - (self.height - 2)) // 2 + 5)
     
     def get(self) -> str:
         """
@@ -27,6 +27,14 @@ import tkinter.filedialog as filedialog
 import customtkinter as ctk
 from tkinter import messagebox
 
+### Local Class Imports ###
+from classes.widgets.image_cache import get_ctk_image
+
+### File Dialog Constants ###
+# Pre-built so the file dialog does not rebuild its options on every click
+_DIALOG_OPTS = {".csv": {"defaultextension": ".csv", "filetypes": (("CSV Files", "*.csv"),)},
+                ".db": {"defaultextension": ".db", "filetypes": (("SQLite Database Files", "*.db"),)}} # file type -> askopenfilename options
+
 class SelectFilePathEntry(ctk.CTkFrame):
     def __init__(self,
                  master,
@@ -57,7 +65,7 @@ class SelectFilePathEntry(ctk.CTkFrame):
         """
         super().__init__(master, fg_color=fg_color, border_color=border_color, border_width=border_width, **kwargs)
         ### Icon Setup ###
-        self.icon = ctk.CTkImage(light_image=icon, dark_image=icon, size=icon_size) if icon else None
+        self.icon = get_ctk_image(icon, icon_size) if icon else None
         self.icon_label = ctk.CTkLabel(self, image=self.icon, text="", fg_color="transparent")
         self.icon_label.pack(side="left", padx=(10,0), pady=5)
 
@@ -82,26 +90,16 @@ class SelectFilePathEntry(ctk.CTkFrame):
         Opens a file dialog for selecting a file path based on the file type. Updates the label and triggers callback if set.
         - event (tk.Event): The event that triggered the dialog. Tkinter Event containing information about the mouse click.
         """
-        file_type = self.file_type if self.file_type else ""
-
         # Only allows certain file types based on the file_type attribute.
-        if file_type == ".csv":
-            file_path = filedialog.askopenfilename(title="Save As",
-                                                   defaultextension=".csv",
-                                                   filetypes=[("CSV Files", "*.csv")]) # only shows csv's and selecting a duplicate will overwrite
-        elif file_type == ".db":
-            file_path = filedialog.askopenfilename(title="Save As",
-                                                   defaultextension=".db",
-                                                   filetypes=[("SQLite Database Files", "*.db")]) # only shows db's and selecting a duplicate will overwrite
+        opts = _DIALOG_OPTS.get(self.file_type)
+        if opts is not None:
+            file_path = filedialog.askopenfilename(title="Save As", **opts) # only shows matching file types
         else:
             messagebox.showerror("No File Type Selected", "Please select a file type to export the entries to.", parent=self.master)
             file_path = ""
         
         self.file_path = file_path
-        if self.file_path:
-            self.path_label.configure(text=self.file_path)
-        else:
-            self.path_label.configure(text=self.placeholder_text)
+        self._set_label_text(self.file_path if self.file_path else self.placeholder_text)
 
         # Trigger the callback with selected file path if provided.
         if self.on_callback:
@@ -122,4 +120,14 @@ class SelectFilePathEntry(ctk.CTkFrame):
         Resets the SelectFilePathEntry widget to its initial state. Clears the stored file path and restores the placeholder text to normal.
         """
         self.file_path = ""
-        self.path_label.configure(text=self.placeholder_text)
\ No newline at end of file
+        self._set_label_text(self.placeholder_text)
+
+    def _set_label_text(self, text: str) -> None:
+        """
+        Private Method
+
+        Updates the path label text, skipping the reconfigure (and CTkLabel redraw) if the text is unchanged.
+        - text (str): The new text for the path label. String as it represents the displayed path or placeholder.
+        """
+        if self.path_label.cget("text") != text:
+            self.path_label.configure(text=text)
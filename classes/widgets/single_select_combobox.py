@@ -25,6 +25,7 @@ Usage:
 ### Module Imports ###
 import tkinter as tk
 import customtkinter as ctk
+import time
 
 class SingleSelectComboBox(ctk.CTkFrame):
     def __init__(self, master, *,
@@ -79,6 +80,8 @@ class SingleSelectComboBox(ctk.CTkFrame):
         ### Font and Colors ###
         self.font = font or ("Arial", 14)
         self.dropdown_font = dropdown_font or ("Arial", 12)
+        # Option rows are plain tk.Labels, which CTk does not scale, so the widget scaling is applied to their font here
+        self.option_font = self._apply_font_scaling(self.dropdown_font)
         self.fg_color = fg_color
         self.border_color = border_color
         self.border_width = border_width
@@ -99,7 +102,7 @@ class SingleSelectComboBox(ctk.CTkFrame):
         self.selected_index = None # Index of currently selected option (None if nothing selected)
         self.option_frames = []
         self.option_labels = []
-        self.prevent_reopen = False
+        self._reopen_block_until = 0.0 # time.monotonic() before which the menu may not reopen (set on close to prevent flickering)
 
         ### Options Translation (Mapping) ###
         self.options_dictionary = options_dictionary # If not provided, options_dictionary is None.
@@ -146,17 +149,17 @@ class SingleSelectComboBox(ctk.CTkFrame):
         self.main_label.bind("<Button-1>", self._toggle_menu)
 
         ### Popup State ###
+        # The popup is built on first open by _show_menu, so comboboxes that are never opened create no dropdown widgets
         self.popup = None
         self.inner_frame = None
         self.is_menu_open = False
 
-        self._create_menu_popup()
-
     def _create_menu_popup(self) -> None:
         """
         Private Method
 
         Creates the popup dropdown menu with scrollable option list. Binds events for mouse wheel and option selection.
+        Called by _show_menu on first open.
         """
         ### Toplevel Popup Setup ###
         self.popup = tk.Toplevel(self)
@@ -181,51 +184,80 @@ class SingleSelectComboBox(ctk.CTkFrame):
         self.canvas.configure(yscrollcommand=scrollbar.set)
 
         ### Inner Frame for Options Rows ###
-        self.inner_frame = tk.Frame(self.canvas, bg=self.dropdown_bg_color, width=self.width)
-        self.inner_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        # Rows are placed at fixed positions (place does not propagate sizes), so the frame is given its full height up front
+        self.inner_frame = tk.Frame(self.canvas, bg=self.dropdown_bg_color, width=self.width, height=40 * len(self.options))
 
         self.canvas.create_window((0, 0), window=self.inner_frame, anchor="nw")
 
-        ### Mouse Enter/Leave Events on Scroll ###
-        self.canvas.bind("<Enter>", lambda e: self._bind_mousewheel())
-        self.canvas.bind("<Leave>", lambda e: self._unbind_mousewheel())
+        ### Mouse Wheel Scrolling ###
+        self._bind_mousewheel()
+
+        ### Row Click Dispatcher ###
+        # One <Button-1> handler for every row frame and label, bound once to a per-widget bindtag added to each row widget
+        self._row_tag = f"SingleSelectComboBoxRow{id(self)}"
+        self._widget_index = {} # Tk path of each row frame/label -> option index
+        self.bind_class(self._row_tag, "<Button-1>", self._on_row_click)
 
         ### Generate Option Rows ###
         for i, option in enumerate(self.options):
-            row_frame = tk.Frame(self.inner_frame, bg=self.dropdown_bg_color, width=self.width, height=40)
-            row_frame.pack(fill="x", anchor="w", pady=0)
-            row_frame.pack_propagate(False)
-
-            label = ctk.CTkLabel(row_frame,
-                                 text=option,
-                                 font=self.dropdown_font,
-                                 text_color=self.unselected_text_color,
-                                 anchor="w",
-                                 justify="left",
-                                 width=self.width - 20)
+            row_frame = tk.Frame(self.inner_frame, bg=self.dropdown_bg_color)
+            row_frame.place(x=0, y=i * 40, width=self.width, height=40) # fixed slot, no pack geometry solving across the rows
+
+            # Native tk.Label (no CTk canvas per row), so repainting an option is a single plain configure
+            label = tk.Label(row_frame,
+                             text=option,
+                             font=self.option_font,
+                             fg=self.unselected_text_color,
+                             bg=self.dropdown_bg_color,
+                             anchor="w",
+                             justify="left")
             label.pack(side="left", fill="x", expand=True, padx=10, pady=0)
 
-            def select_option(idx=i):
-                """
-                Updates selected index, visuals, label, and closes dropdown.
-                """
-                # Set single selected index
-                self.selected_index = idx
-                
-                self._update_all_options()
-                self._on_select()
-
-                # Close menu after selection
-                self._hide_menu()
-
-            row_frame.bind("<Button-1>", lambda e, idx=i: select_option(idx))
-            label.bind("<Button-1>", lambda e, idx=i: select_option(idx))
+            for widget in (row_frame, label):
+                widget.bindtags((self._row_tag,) + widget.bindtags())
+                self._widget_index[str(widget)] = i
 
             self.option_frames.append(row_frame)
             self.option_labels.append(label)
 
+        # Rows are a fixed 40px high, so the scroll region is known without a bbox("all") walk on every inner frame <Configure>
+        self.canvas.configure(scrollregion=(0, 0, self.width, 40 * len(self.options)))
+
+        # Paint an option selected (e.g. via set_selected_option) before the popup existed
+        if self.selected_index is not None:
+            self._update_option_visual(self.selected_index)
+
         self.popup.bind("<FocusOut>", self._on_popup_focus_out)
 
+    def _on_row_click(self, event) -> str:
+        """
+        Private Method
+
+        Shared click handler for all option rows. Looks up the clicked row's option index and selects it.
+        - event (tk.Event): The click event. Tkinter Event containing the clicked widget.
+        """
+        idx = self._widget_index.get(str(event.widget))
+        if idx is not None:
+            self._select_option(idx)
+        return "break"
+
+    def _select_option(self, idx) -> None:
+        """
+        Private Method
+
+        Updates selected index, visuals, label, and closes dropdown.
+        - idx (int): The index of the option to select. Integer as it represents the option's position.
+        """
+        # Set single selected index
+        prev_index = self.selected_index
+        self.selected_index = idx
+
+        self._repaint_selection_change(prev_index)
+        self._on_select()
+
+        # Close menu after selection
+        self._hide_menu()
+
     def _update_option_visual(self, idx) -> None:
         """
         Private Method
@@ -237,41 +269,38 @@ class SingleSelectComboBox(ctk.CTkFrame):
         frame = self.option_frames[idx]
         label = self.option_labels[idx]
 
+        # tk.Label is opaque, so its background follows the row's
         if selected:
             frame.configure(bg=self.selected_bg_color)
-            label.configure(text_color=self.selected_text_color)
+            label.configure(fg=self.selected_text_color, bg=self.selected_bg_color)
         else:
             frame.configure(bg=self.dropdown_bg_color)
-            label.configure(text_color=self.unselected_text_color)
+            label.configure(fg=self.unselected_text_color, bg=self.dropdown_bg_color)
 
-    def _update_all_options(self) -> None:
+    def _repaint_selection_change(self, prev_index) -> None:
         """
         Private Method
 
-        Updates the visual appearance of all option rows and labels.
+        Repaints only the rows affected by a selection change (the previously and newly selected options), instead of every option.
+        - prev_index (int | None): The index selected before the change. Integer as it represents the option's position, None if nothing was selected.
         """
-        for idx in range(len(self.options)):
-            self._update_option_visual(idx)
+        if self.popup is None: # rows not built yet, the selection is painted when the popup is created
+            return
+        if prev_index is not None and prev_index != self.selected_index:
+            self._update_option_visual(prev_index)
+        if self.selected_index is not None:
+            self._update_option_visual(self.selected_index)
 
     def _bind_mousewheel(self) -> None:
         """
         Private Method
 
         Enables mouse wheel scrolling for the dropdown canvas. Supports various mouse wheel events for different platforms.
-        """ 
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
-
-    def _unbind_mousewheel(self) -> None:
-        """
-        Private Method
-
-        Disables mouse wheel scrolling for the dropdown canvas.
+        Bound once on the popup window (whose bindtag every row widget carries), so no global bind_all/unbind_all is needed on enter/leave.
         """
-        self.canvas.unbind_all("<MouseWheel>")
-        self.canvas.unbind_all("<Button-4>")
-        self.canvas.unbind_all("<Button-5>")
+        self.popup.bind("<MouseWheel>", self._on_mousewheel)
+        self.popup.bind("<Button-4>", self._on_mousewheel)
+        self.popup.bind("<Button-5>", self._on_mousewheel)
 
     def _on_mousewheel(self, event) -> None:
         """
@@ -294,15 +323,17 @@ class SingleSelectComboBox(ctk.CTkFrame):
         """
         if self.is_menu_open:
             self._hide_menu()
-        elif not self.prevent_reopen:
+        elif time.monotonic() >= self._reopen_block_until:
             self._show_menu()
 
     def _show_menu(self) -> None:
         """
         Private Method
 
-        Displays the dropdown menu below the combobox. Focuses the popup for keyboard interaction.
+        Displays the dropdown menu below the combobox. Focuses the popup for keyboard interaction. Builds the popup on first open.
         """
+        if self.popup is None:
+            self._create_menu_popup()
         x = self.winfo_rootx()
         y = self.winfo_rooty() + self.winfo_height()
         self.popup.geometry(f"{self.width}x{self.dropdown_height}+{x}+{y}")
@@ -331,9 +362,8 @@ class SingleSelectComboBox(ctk.CTkFrame):
                 translated_option = self.options_dictionary.get(self.get_selected(), self.get_selected())
             self.on_close_callback(translated_option)
 
-        self.prevent_reopen = True
-        # Allow reopening after a short delay to prevent flickering
-        self.after(150, lambda: setattr(self, 'prevent_reopen', False))
+        # Allow reopening after a short delay to prevent flickering (checked in _toggle_menu, so no timer is scheduled)
+        self._reopen_block_until = time.monotonic() + 0.15
 
     def _on_popup_focus_out(self, event=None) -> None:
         """
@@ -384,8 +414,9 @@ class SingleSelectComboBox(ctk.CTkFrame):
         - option (str): The string value of the option to select. String as it represents the option in the dropdown.
         """
         if option in self.options:
+            prev_index = self.selected_index
             self.selected_index = self.options.index(option)
-            self._update_all_options()
+            self._repaint_selection_change(prev_index)
             self._on_select()
         else:
             raise ValueError(f"Option '{option}' not found in options list.")
\ No newline at end of file